@@ -1,9 +1,16 @@
 import streamlit as st
 import pandas as pd
-import folium
-from streamlit_folium import folium_static
+import numpy as np
+import pydeck as pdk
 import os
-from geopy.geocoders import Nominatim
+import json
+import html
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
 
 # Set page configuration
 st.set_page_config(
@@ -12,114 +19,124 @@ st.set_page_config(
     layout="wide"
 )
 
-# Custom CSS for better styling and improved contrast
-st.markdown("""
-<style>
-  
-    .stApp {
-        background-color: #0f172a !important; 
-        color: #e6eef8 !important; 
-    }
-
-   
-    .stApp * {
-        color: #e6eef8 !important;
-    }
-
-    /* Card styles */
-    .destination-card {
-        background-color: #0b1220 !important; /* darker card */
-        color: #e6eef8 !important;
-        border-radius: 10px;
-        padding: 20px;
-        margin-bottom: 20px;
-        box-shadow: 0 2px 6px rgba(0,0,0,0.6);
-    }
-
-  
-    .stButton>button {
-        background-color: #2563eb !important; /* blue */
-        color: #ffffff !important;
-        border-radius: 6px !important;
-        padding: 0.5rem 1rem !important;
-        box-shadow: 0 2px 6px rgba(37,99,235,0.3) !important;
-    }
-
-    /* Inputs*/
-    .stTextInput>div>div>input,
-    .stSelectbox>div>div>div>div{
-        background-color: #071021 !important;
-        color: #e6eef8 !important;
-        border: 1px solid rgba(255,255,255,0.06) !important;
-        border-radius: 8px !important;
-    }
-
-    /* Headers */
-    h1, h2, h3, .css-ffhzg2 {
-        color: #f8fafc !important;
-        font-weight: 700 !important;
-    }
-
-    /* Expander header */
-    .stExpander > button {
-        background-color: #0b1220 !important;
-        color: #e6eef8 !important;
-        border-radius: 6px !important;
-    }
-
-    /* Map container adjustments */
-    .stFrame > iframe {
-        border-radius: 8px !important;
-    }
-
-    /* Ensure small text remains legible */
-    .stCaption, .stMarkdown, .stText {
-        color: #dbeafe !important;
-    }
-
-</style>
-""", unsafe_allow_html=True)
-
-# Load data
-@st.cache_data
-def load_data():
+# Custom CSS for better styling and improved contrast, cached so the
+# stylesheet is read from disk once per process rather than every rerun
+@st.cache_resource
+def load_css() -> str:
+    with open('style.css') as f:
+        return f'<style>{f.read()}</style>'
+
+
+st.markdown(load_css(), unsafe_allow_html=True)
+
+def read_destinations_csv(**kwargs):
+    """
+    read_csv wrapper that prefers the multithreaded pyarrow engine and
+    falls back to the default C engine when pyarrow is missing or
+    rejects one of the passed options.
+    """
+    if HAS_PYARROW:
+        try:
+            return pd.read_csv('destinations.csv', encoding='utf-8-sig', engine='pyarrow', **kwargs)
+        except (ValueError, TypeError):
+            pass
+    return pd.read_csv('destinations.csv', encoding='utf-8-sig', **kwargs)
+
+
+# Load data. cache_resource skips cache_data's per-retrieval hash of the
+# returned frame; main() treats the frame as read-only so sharing is safe.
+@st.cache_resource
+def load_data(csv_mtime: float, csv_size: int):
     """
     Robust CSV loader that maps existing CSV headers to the app's expected columns.
+    csv_mtime/csv_size are only used as the cache key: the cached frame is
+    reused for as long as the CSV's stat is unchanged, and any stat change
+    (including a touch that rewrites nothing) forces a fresh load.
     It tolerates the repo's current columns by mapping 'significance' -> description and 'type' -> popular_attractions.
+    The parsed result is cached as destinations.parquet so cold starts skip
+    the CSV parse and normalization as long as the CSV hasn't changed.
     """
     try:
-        df = pd.read_csv('destinations.csv', encoding='utf-8-sig')
-
-        # Normalize column names: strip, lower, replace spaces with _
-        orig_cols = list(df.columns)
-        norm_cols = [str(c).strip().lower().replace(' ', '_') for c in orig_cols]
-        df.rename(columns=dict(zip(orig_cols, norm_cols)), inplace=True)
-
-        # Drop any unnamed index column (common when saving CSVs with index)
-        df = df.loc[:, ~df.columns.str.startswith('unnamed')]
-
-        # Synonyms for common alternate headers (extended to match your CSV)
-        synonyms = {
-            'name': ['name', 'destination', 'place', 'title', 'location'],
-            'state': ['state', 'region', 'province'],
-            'description': ['description', 'desc', 'details', 'about', 'significance'],
-            'popular_attractions': ['popular_attractions', 'attractions', 'popular_attraction', 'attraction', 'type'],
-            'image_url': ['image_url', 'image', 'image_link', 'imageurl', 'photo', 'photo_url'],
-            'latitude': ['latitude', 'lat'],
-            'longitude': ['longitude', 'lon', 'long', 'lng']
+        # Prefer the parquet cache when it's at least as new as the CSV
+        if HAS_PYARROW and os.path.exists('destinations.parquet') \
+                and os.path.getmtime('destinations.parquet') >= os.path.getmtime('destinations.csv'):
+            df = pd.read_parquet('destinations.parquet')
+            df.attrs['states'] = ['All'] + sorted(df['state'].dropna().unique().tolist())
+            return df
+
+        # Explicit dtypes so read_csv can skip type inference when the
+        # header mapping is already known
+        dtypes = {
+            'name': 'string',
+            'state': 'category',
+            'description': 'string',
+            'popular_attractions': 'string',
+            'image_url': 'string',
+            'latitude': 'float32',
+            'longitude': 'float32'
         }
 
-        # Find and rename columns to the canonical names used in the app
-        found = {}
-        for canonical, options in synonyms.items():
-            for opt in options:
-                if opt in df.columns:
-                    found[canonical] = opt
-                    break
-
-        rename_map = {found[k]: k for k in found}
-        if rename_map:
-            df.rename(columns=rename_map, inplace=True)
+        # Fast path: reuse the header mapping resolved on a previous load
+        # (canonical column -> raw CSV header), skipping normalization
+        # and synonym matching entirely
+        df = None
+        if os.path.exists('destinations.schema.json') \
+                and os.path.getmtime('destinations.schema.json') >= os.path.getmtime('destinations.csv'):
+            try:
+                with open('destinations.schema.json') as f:
+                    schema = json.load(f)
+                df = read_destinations_csv(
+                    usecols=list(schema.values()),
+                    dtype={raw: dtypes[canonical] for canonical, raw in schema.items() if canonical in dtypes}
+                )
+                df.rename(columns={raw: canonical for canonical, raw in schema.items()}, inplace=True)
+            except (OSError, ValueError):
+                df = None  # stale/invalid schema; fall back to full parse
+
+        if df is None:
+            df = read_destinations_csv()
+
+            # Normalize column names: strip, lower, replace spaces with _
+            orig_cols = list(df.columns)
+            norm_cols = [str(c).strip().lower().replace(' ', '_') for c in orig_cols]
+            df.rename(columns=dict(zip(orig_cols, norm_cols)), inplace=True)
+
+            # Drop any unnamed index column (common when saving CSVs with
+            # index); the pyarrow engine leaves its name empty rather than
+            # 'unnamed:_0', so filter both spellings
+            df = df.loc[:, ~df.columns.str.startswith('unnamed') & (df.columns != '')]
+
+            # Synonyms for common alternate headers (extended to match your CSV)
+            synonyms = {
+                'name': ['name', 'destination', 'place', 'title', 'location'],
+                'state': ['state', 'region', 'province'],
+                'description': ['description', 'desc', 'details', 'about', 'significance'],
+                'popular_attractions': ['popular_attractions', 'attractions', 'popular_attraction', 'attraction', 'type'],
+                'image_url': ['image_url', 'image', 'image_link', 'imageurl', 'photo', 'photo_url'],
+                'latitude': ['latitude', 'lat'],
+                'longitude': ['longitude', 'lon', 'long', 'lng']
+            }
+
+            # Find and rename columns to the canonical names used in the app
+            found = {}
+            for canonical, options in synonyms.items():
+                for opt in options:
+                    if opt in df.columns:
+                        found[canonical] = opt
+                        break
+
+            rename_map = {found[k]: k for k in found}
+            if rename_map:
+                df.rename(columns=rename_map, inplace=True)
+
+            # Persist the resolved mapping (canonical -> raw header) so the
+            # next cold load can take the fast path above
+            norm_to_orig = dict(zip(norm_cols, orig_cols))
+            try:
+                with open('destinations.schema.json', 'w') as f:
+                    json.dump({k: norm_to_orig[v] for k, v in found.items()}, f, indent=2)
+            except OSError:
+                pass  # read-only deployment; just re-resolve next time
 
         #
         required_columns = ['name', 'state']
@@ -150,10 +167,46 @@ def load_data():
         # Drop rows missing essential info
         df = df.dropna(subset=['name', 'state'])
 
-        # Convert lat/lon to numeric if present
+        # Convert lat/lon to numeric if present; float32 is plenty for
+        # ~6-decimal coordinates and halves the columns' memory
         for coord in ('latitude', 'longitude'):
             if coord in df.columns:
-                df[coord] = pd.to_numeric(df[coord], errors='coerce')
+                df[coord] = pd.to_numeric(df[coord], errors='coerce', downcast='float')
+
+        # Precompute a lowercased blob of the searchable columns so the
+        # search filter scans one column instead of three
+        df['_search_blob'] = (
+            df['name'].fillna('')
+            + '\x1f' + df['description'].fillna('')
+            + '\x1f' + df['popular_attractions'].fillna('')
+        ).str.lower()
+
+        # Split attractions once here instead of per card per rerun
+        df['attractions_list'] = (
+            df['popular_attractions'].fillna('')
+            .str.split(r'\s*,\s*', regex=True)
+            .apply(lambda xs: [x for x in xs if x])
+        )
+
+        # Categorical state turns the sidebar equality filter into an
+        # integer code comparison instead of per-row string equality
+        df['state'] = df['state'].astype('category')
+
+        # Arrow-backed strings route str.contains through pyarrow's C++
+        # substring kernel instead of per-cell Python comparisons
+        if HAS_PYARROW:
+            for col in ('name', 'description', 'popular_attractions', '_search_blob'):
+                df[col] = df[col].astype('string[pyarrow]')
+
+        # Persist the fully normalized frame; the CSV stays authoritative
+        if HAS_PYARROW:
+            try:
+                df.to_parquet('destinations.parquet', index=False)
+            except OSError:
+                pass  # read-only deployment; just reparse next time
+
+        # Sidebar state options, computed once here instead of every rerun
+        df.attrs['states'] = ['All'] + sorted(df['state'].dropna().unique().tolist())
 
         return df
 
@@ -172,8 +225,14 @@ def main():
     st.title("🌍 Explore India - Tourist Destinations")
     st.write("Discover the most amazing places to visit in India")
 
-    # Load data
-    df = load_data()
+    # Load data, keyed on the CSV's stat so unchanged files always hit cache
+    try:
+        csv_stat = os.stat('destinations.csv')
+    except OSError:
+        st.error("destinations.csv not found. Please place destinations.csv in the app directory.")
+        return
+
+    df = load_data(csv_stat.st_mtime, csv_stat.st_size)
     if df is None:
         st.warning("No data found. Please ensure destinations.csv exists with the required columns.")
         return
@@ -184,23 +243,19 @@ def main():
     # Universal search
     search_query = st.sidebar.text_input("Search destinations...")
 
-    # State filter
-    states = ['All'] + sorted(df['state'].unique().tolist())
-    selected_state = st.sidebar.selectbox("Select State", states)
-
-    # Apply filters
-    filtered_df = df.copy()
+    # State filter (options precomputed in load_data)
+    selected_state = st.sidebar.selectbox("Select State", df.attrs['states'])
 
+    # Apply filters: combine the conditions as raw numpy masks and index
+    # once, skipping intermediate Series and a second filtered frame
+    mask = None
     if search_query:
-        mask = (
-            df['name'].str.contains(search_query, case=False, na=False)
-            | df['description'].str.contains(search_query, case=False, na=False)
-            | df['popular_attractions'].str.contains(search_query, case=False, na=False)
-        )
-        filtered_df = filtered_df[mask]
-
+        mask = df['_search_blob'].str.contains(search_query.lower(), regex=False, na=False).to_numpy()
     if selected_state != 'All':
-        filtered_df = filtered_df[filtered_df['state'] == selected_state]
+        state_mask = (df['state'] == selected_state).to_numpy()
+        mask = state_mask if mask is None else np.logical_and(mask, state_mask, out=mask)
+
+    filtered_df = df[mask] if mask is not None else df
 
     # Display results
     st.header(f"🗺️ {len(filtered_df)} Destinations Found")
@@ -213,19 +268,29 @@ def main():
         if 'latitude' in df.columns and 'longitude' in df.columns:
             st.subheader("Map View")
             if not filtered_df.empty:
-                # Create a map centered on India
-                m = folium.Map(location=[20.5937, 78.9629], zoom_start=5)
-
-                # Add markers for each destination
-                for idx, row in filtered_df.iterrows():
-                    if pd.notnull(row.get('latitude')) and pd.notnull(row.get('longitude')):
-                        folium.Marker(
-                            [row['latitude'], row['longitude']],
-                            popup=row['name'],
-                            tooltip=row['name']
-                        ).add_to(m)
-
-                folium_static(m, width=700, height=400)
+                geo = filtered_df[['latitude', 'longitude', 'name']].dropna()
+
+                # One selectbox to focus the map, instead of one button per card
+                picked = st.selectbox("Center map on:", ['-'] + geo['name'].tolist(), key='focus')
+                center, zoom = (20.5937, 78.9629), 4
+                if picked != '-':
+                    focus = geo[geo['name'] == picked].iloc[0]
+                    center, zoom = (float(focus['latitude']), float(focus['longitude'])), 10
+
+                # WebGL scatter layer: one GPU buffer for all points, so
+                # rerender cost doesn't grow with the marker count the way
+                # per-marker Leaflet HTML does
+                layer = pdk.Layer(
+                    'ScatterplotLayer',
+                    data=geo,
+                    get_position='[longitude, latitude]',
+                    get_fill_color=[37, 99, 235, 200],
+                    get_radius=8000,
+                    radius_min_pixels=4,
+                    pickable=True
+                )
+                view = pdk.ViewState(latitude=center[0], longitude=center[1], zoom=zoom)
+                st.pydeck_chart(pdk.Deck(layers=[layer], initial_view_state=view, tooltip={'text': '{name}'}))
 
     with col2:
         # Display filters summary
@@ -240,33 +305,58 @@ def main():
     if filtered_df.empty:
         st.warning("No destinations found matching your criteria. Try adjusting your filters.")
     else:
-        for idx, row in filtered_df.iterrows():
-            with st.expander(f"{row['name']}, {row['state']}", expanded=True):
-                c1, c2 = st.columns([1, 2])
-
-                with c1:
-                    img = row.get('image_url') if pd.notnull(row.get('image_url')) and row.get('image_url') else None
-                    if img:
-                        st.image(img, use_column_width=True, caption=row['name'])
-                    else:
-                        st.text("No image available")
-
-                with c2:
-                    st.write(f"**State:** {row['state']}")
-                    st.write(f"**Description:** {row['description']}")
-                    if 'popular_attractions' in row and pd.notnull(row['popular_attractions']) and row['popular_attractions']:
-                        st.write("**Popular Attractions:**")
-                        attractions = [a.strip() for a in str(row['popular_attractions']).split(',') if a.strip()]
-                        for attraction in attractions:
-                            st.write(f"- {attraction}")
-
-                    if 'latitude' in row and 'longitude' in row and pd.notnull(row['latitude']) and pd.notnull(row['longitude']):
-                        st.button(
-                            f"View on Map",
-                            key=f"btn_{idx}",
-                            on_click=None,
-                            help=f"Show {row['name']} on the map"
-                        )
+        # Paginate so render cost is bounded no matter how many rows match;
+        # reset to the first page whenever the filters change
+        page_size = 20
+        filters_key = (search_query, selected_state)
+        if st.session_state.get('filters_key') != filters_key:
+            st.session_state['filters_key'] = filters_key
+            st.session_state['page'] = 1
+        page = st.session_state.get('page', 1)
+        page_df = filtered_df.head(page * page_size)
+
+        # Build each card as one HTML string and emit them in a single
+        # st.markdown call, instead of ~6-8 Streamlit calls per card
+        # (itertuples yields lightweight namedtuples instead of boxing
+        # each row into a Series like iterrows does)
+        cards = []
+        for row in page_df.itertuples(index=False):
+            # Escape CSV-sourced text: it lands inside unsafe_allow_html
+            # markup, including attribute values
+            name = html.escape(str(row.name))
+            state = html.escape(str(row.state))
+            description = html.escape(str(row.description))
+
+            img = row.image_url if pd.notnull(row.image_url) and row.image_url else None
+            if img:
+                # loading="lazy" lets the browser defer off-screen
+                # image fetches, unlike st.image which loads eagerly
+                img_html = f'<img src="{html.escape(str(img))}" loading="lazy" style="width:100%;max-width:320px;border-radius:8px" alt="{name}">'
+            else:
+                img_html = '<p><em>No image available</em></p>'
+
+            attractions_html = ''
+            if len(row.attractions_list):
+                items = ''.join(f'<li>{html.escape(str(a))}</li>' for a in row.attractions_list)
+                attractions_html = f'<p><strong>Popular Attractions:</strong></p><ul>{items}</ul>'
+
+            cards.append(
+                f'<div class="destination-card">'
+                f'<h3>{name}, {state}</h3>'
+                f'{img_html}'
+                f'<p><strong>State:</strong> {state}</p>'
+                f'<p><strong>Description:</strong> {description}</p>'
+                f'{attractions_html}'
+                f'</div>'
+            )
+
+        st.markdown(''.join(cards), unsafe_allow_html=True)
+
+        if len(filtered_df) > len(page_df):
+            st.button(
+                f"Load more ({len(filtered_df) - len(page_df)} remaining)",
+                on_click=lambda: st.session_state.update(page=page + 1)
+            )
 
 
 if __name__ == "__main__":